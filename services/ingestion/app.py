@@ -6,17 +6,23 @@ into structured JSON, and writes the result to GCS.
 
 from __future__ import annotations
 
-import json
+import asyncio
+import datetime
+import gzip
+import hashlib
 import logging
 import os
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 
 import google.cloud.logging as gcloud_logging
 import httpx
+import orjson
 from fastapi import FastAPI, HTTPException
 from google.cloud import storage
 from pydantic import BaseModel
 
-from parser import ParsedReport, parse_report
+from parser import PARSER_VERSION, ParsedReport, parse_report
 
 # ---------------------------------------------------------------------------
 # Configuration
@@ -29,6 +35,21 @@ ISW_BASE_URL = os.environ.get(
     "russian-offensive-campaign-assessment-{slug}/",
 )
 
+_MONTHS_LC = (
+    "january",
+    "february",
+    "march",
+    "april",
+    "may",
+    "june",
+    "july",
+    "august",
+    "september",
+    "october",
+    "november",
+    "december",
+)
+
 # ---------------------------------------------------------------------------
 # Logging
 # ---------------------------------------------------------------------------
@@ -40,10 +61,57 @@ if os.environ.get("K_SERVICE"):
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
+# ---------------------------------------------------------------------------
+# GCS
+# ---------------------------------------------------------------------------
+# Client construction does credential discovery, so build it once per process.
+#
+# Reports and parsed JSON are far below the client's 8 MiB multipart threshold,
+# so upload_from_string sends them in a single request with no chunk buffer.
+# Blob.chunk_size is deliberately left unset: it only applies to resumable
+# uploads, and setting it would not shrink these single-shot requests.
+_gcs_client: storage.Client | None = None
+_gcs_bucket: storage.Bucket | None = None
+
+
+def _get_bucket() -> storage.Bucket:
+    """Return the pipeline bucket, creating the GCS client on first use."""
+    global _gcs_client, _gcs_bucket
+    if _gcs_bucket is None:
+        _gcs_client = storage.Client()
+        _gcs_bucket = _gcs_client.bucket(BUCKET_NAME)
+    return _gcs_bucket
+
+
 # ---------------------------------------------------------------------------
 # FastAPI app
 # ---------------------------------------------------------------------------
-app = FastAPI(title="ISW Ingestion Service")
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Create the shared HTTP client on startup and close it on shutdown.
+
+    Reusing one HTTP/2 keep-alive client avoids a TCP+TLS handshake to the
+    ISW site on every request.
+    """
+    app.state.http_client = httpx.AsyncClient(
+        timeout=30,
+        http2=True,
+        follow_redirects=True,
+        headers={
+            "User-Agent": (
+                "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+                "AppleWebKit/537.36 (KHTML, like Gecko) "
+                "Chrome/131.0.0.0 Safari/537.36"
+            )
+        },
+    )
+    try:
+        yield
+    finally:
+        await app.state.http_client.aclose()
+
+
+app = FastAPI(title="ISW Ingestion Service", lifespan=lifespan)
 
 
 class IngestRequest(BaseModel):
@@ -61,61 +129,91 @@ class IngestResponse(BaseModel):
 
 def _date_to_slug(date_str: str) -> str:
     """Convert '2026-02-16' → 'february-16-2026'."""
-    import datetime
-
     dt = datetime.date.fromisoformat(date_str)
-    return dt.strftime("%B-%-d-%Y").lower()
+    return f"{_MONTHS_LC[dt.month - 1]}-{dt.day}-{dt.year}"
 
 
-def _fetch_html_from_url(date_str: str) -> str:
+async def _fetch_html_from_url(date_str: str) -> bytes:
     """Fetch ISW report HTML from the public website."""
     slug = _date_to_slug(date_str)
     url = ISW_BASE_URL.format(slug=slug)
     logger.info("Fetching ISW report from %s", url)
 
-    with httpx.Client(timeout=30, follow_redirects=True) as client:
-        resp = client.get(
-            url,
-            headers={
-                "User-Agent": (
-                    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-                    "AppleWebKit/537.36 (KHTML, like Gecko) "
-                    "Chrome/131.0.0.0 Safari/537.36"
-                )
-            },
-        )
-        resp.raise_for_status()
-    return resp.text
+    client: httpx.AsyncClient = app.state.http_client
+    resp = await client.get(url)
+    resp.raise_for_status()
+    return resp.content
+
 
+def _fetch_html_from_gcs(gcs_path: str) -> bytes:
+    """Download HTML from a GCS path like gs://bucket/raw/2026-02-16/report.html.
 
-def _fetch_html_from_gcs(gcs_path: str) -> str:
-    """Download HTML from a GCS path like gs://bucket/raw/2026-02-16/report.html."""
+    Raw reports are stored with ``Content-Encoding: gzip``; this relies on the
+    storage client returning them decompressed (decompressive transcoding).
+    """
     # Strip gs://bucket/ prefix
     path = gcs_path.replace(f"gs://{BUCKET_NAME}/", "")
-    gcs = storage.Client()
-    bucket = gcs.bucket(BUCKET_NAME)
+    bucket = _get_bucket()
     blob = bucket.blob(path)
-    return blob.download_as_text()
+    return blob.download_as_bytes()
 
 
-def _upload_raw_html(date_str: str, html: str) -> str:
-    """Store the raw HTML in GCS for reproducibility."""
-    gcs = storage.Client()
-    bucket = gcs.bucket(BUCKET_NAME)
+def _upload_raw_html(date_str: str, html: bytes) -> str:
+    """Store the raw HTML in GCS for reproducibility.
+
+    The object is gzip-compressed with ``Content-Encoding: gzip``; GCS
+    decompresses it transparently for clients that don't accept gzip.
+    """
+    bucket = _get_bucket()
     blob_path = f"raw/{date_str}/report.html"
     blob = bucket.blob(blob_path)
-    blob.upload_from_string(html, content_type="text/html")
+    blob.content_encoding = "gzip"
+    blob.upload_from_string(
+        gzip.compress(html, compresslevel=6), content_type="text/html"
+    )
     return f"gs://{BUCKET_NAME}/{blob_path}"
 
 
-def _upload_parsed_report(date_str: str, report: ParsedReport) -> str:
-    """Upload parsed JSON to GCS and return the path."""
-    gcs = storage.Client()
-    bucket = gcs.bucket(BUCKET_NAME)
-    blob_path = f"parsed/{date_str}/parsed_report.json"
+def _parsed_blob_path(date_str: str) -> str:
+    """Return the object path of the parsed report for a date."""
+    return f"parsed/{date_str}/parsed_report.json"
+
+
+def _find_cached_report(date_str: str, html_sha256: str) -> str | None:
+    """Return the parsed report path if it is current for this HTML.
+
+    A stored report is current when both its source hash and parser version
+    match.
+    """
+    bucket = _get_bucket()
+    blob_path = _parsed_blob_path(date_str)
+    existing = bucket.get_blob(blob_path)
+    if existing is None:
+        return None
+    metadata = existing.metadata or {}
+    if (
+        metadata.get("src_sha256") == html_sha256
+        and metadata.get("parser_version") == PARSER_VERSION
+    ):
+        return f"gs://{BUCKET_NAME}/{blob_path}"
+    return None
+
+
+def _upload_parsed_report(
+    date_str: str, report: ParsedReport, html_sha256: str
+) -> str:
+    """Upload parsed JSON to GCS and return the path.
+
+    The source HTML hash and parser version are stored as object metadata
+    so identical re-ingestions can be short-circuited by
+    ``_find_cached_report``.
+    """
+    bucket = _get_bucket()
+    blob_path = _parsed_blob_path(date_str)
     blob = bucket.blob(blob_path)
+    blob.metadata = {"src_sha256": html_sha256, "parser_version": PARSER_VERSION}
     blob.upload_from_string(
-        json.dumps(report.to_dict(), ensure_ascii=False, indent=2),
+        orjson.dumps(report.to_dict()),
         content_type="application/json",
     )
     return f"gs://{BUCKET_NAME}/{blob_path}"
@@ -129,16 +227,31 @@ async def ingest(request: IngestRequest) -> IngestResponse:
     try:
         # 1. Obtain HTML
         if request.html_gcs_path:
-            html = _fetch_html_from_gcs(request.html_gcs_path)
+            html = await asyncio.to_thread(_fetch_html_from_gcs, request.html_gcs_path)
         else:
-            html = _fetch_html_from_url(request.date)
+            html = await _fetch_html_from_url(request.date)
 
-        # 2. Store raw HTML
-        _upload_raw_html(request.date, html)
-        logger.info("Raw HTML stored for date=%s", request.date)
+        # Skip parsing if this exact HTML was already processed for the date
+        html_sha256 = hashlib.sha256(html).hexdigest()
+        cached_path = await asyncio.to_thread(
+            _find_cached_report, request.date, html_sha256
+        )
+        if cached_path:
+            logger.info("Report unchanged, reusing %s", cached_path)
+            return IngestResponse(parsed_report_path=cached_path)
+
+        # 2. Store raw HTML in the background so the upload overlaps the parse
+        raw_task = asyncio.create_task(
+            asyncio.to_thread(_upload_raw_html, request.date, html)
+        )
 
         # 3. Parse
-        report = parse_report(html)
+        try:
+            report = await asyncio.to_thread(parse_report, html)
+        except Exception:
+            # Still keep the raw HTML for debugging the failed parse
+            await asyncio.gather(raw_task, return_exceptions=True)
+            raise
         logger.info(
             "Parsed report: %d toplines, %d key_takeaways, %d sections",
             len(report.toplines),
@@ -146,8 +259,14 @@ async def ingest(request: IngestRequest) -> IngestResponse:
             len(report.sections),
         )
 
-        # 4. Upload parsed JSON
-        parsed_path = _upload_parsed_report(request.date, report)
+        # 4. Upload parsed JSON. The raw upload must finish first: the parsed
+        # blob's hash metadata marks the date as done, and a retry would
+        # otherwise skip a raw upload that failed.
+        await raw_task
+        logger.info("Raw HTML stored for date=%s", request.date)
+        parsed_path = await asyncio.to_thread(
+            _upload_parsed_report, request.date, report, html_sha256
+        )
         logger.info("Parsed report stored at %s", parsed_path)
 
         return IngestResponse(parsed_report_path=parsed_path)
@@ -6,10 +6,40 @@ daily assessment HTML pages into a JSON-serializable dict.
 
 from __future__ import annotations
 
+import copy
+import hashlib
 import re
-from dataclasses import asdict, dataclass, field
-
-from bs4 import BeautifulSoup, Tag
+from dataclasses import dataclass, field
+
+from selectolax.lexbor import LexborHTMLParser, LexborNode
+
+# Bump whenever parse_report's output changes for the same HTML, so cached
+# parsed reports built by an older parser are regenerated.
+PARSER_VERSION = "2"
+
+# Type aliases for the parsed DOM
+Tag = LexborNode
+HTMLTree = LexborHTMLParser
+
+_MONTHS: dict[str, int] = {
+    "January": 1,
+    "February": 2,
+    "March": 3,
+    "April": 4,
+    "May": 5,
+    "June": 6,
+    "July": 7,
+    "August": 8,
+    "September": 9,
+    "October": 10,
+    "November": 11,
+    "December": 12,
+}
+
+# "<Word> <day>, <year>" — the word is checked against _MONTHS afterwards
+_DATE_RE = re.compile(r"(\w+)\s+(\d{1,2}),\s+(\d{4})")
+# Endnote URLs, allowing ISW's " dot " obfuscation inside the match
+_URL_RE = re.compile(r"https?://(?:[^\s,;]| dot )+")
 
 
 @dataclass
@@ -17,6 +47,9 @@ class Topline:
     headline: str
     body: str
 
+    def to_dict(self) -> dict:
+        return {"headline": self.headline, "body": self.body}
+
 
 @dataclass
 class Section:
@@ -26,6 +59,15 @@ class Section:
     map_url: str | None = None
     map_title: str | None = None
 
+    def to_dict(self) -> dict:
+        return {
+            "id": self.id,
+            "title": self.title,
+            "body": self.body,
+            "map_url": self.map_url,
+            "map_title": self.map_title,
+        }
+
 
 @dataclass
 class ParsedReport:
@@ -38,7 +80,16 @@ class ParsedReport:
     source_refs: list[str] = field(default_factory=list)
 
     def to_dict(self) -> dict:
-        return asdict(self)
+        # Built by hand: dataclasses.asdict deep-copies every nested value
+        return {
+            "date": self.date,
+            "title": self.title,
+            "toplines": [t.to_dict() for t in self.toplines],
+            "key_takeaways": list(self.key_takeaways),
+            "sections": [s.to_dict() for s in self.sections],
+            "overview_map_url": self.overview_map_url,
+            "source_refs": list(self.source_refs),
+        }
 
 
 def _extract_date_from_title(title: str) -> str:
@@ -47,40 +98,48 @@ def _extract_date_from_title(title: str) -> str:
 
     Returns ISO-format date string (YYYY-MM-DD).
     """
-    match = re.search(
-        r"(January|February|March|April|May|June|July|August|"
-        r"September|October|November|December)\s+(\d{1,2}),\s+(\d{4})",
-        title,
+    match = next(
+        (m for m in _DATE_RE.finditer(title) if m.group(1) in _MONTHS), None
     )
     if not match:
         msg = f"Could not extract date from title: {title}"
         raise ValueError(msg)
 
     month_str, day_str, year_str = match.groups()
-    months = {
-        "January": 1,
-        "February": 2,
-        "March": 3,
-        "April": 4,
-        "May": 5,
-        "June": 6,
-        "July": 7,
-        "August": 8,
-        "September": 9,
-        "October": 10,
-        "November": 11,
-        "December": 12,
-    }
-    month = months[month_str]
+    month = _MONTHS[month_str]
     day = int(day_str)
     year = int(year_str)
     return f"{year:04d}-{month:02d}-{day:02d}"
 
 
 def _clean_text(text: str) -> str:
-    """Normalise whitespace in extracted text."""
-    text = text.replace("\xa0", " ")
-    return re.sub(r"\s+", " ", text).strip()
+    """Normalise whitespace in extracted text.
+
+    ``str.split()`` already treats non-breaking spaces as whitespace.
+    """
+    return " ".join(text.split())
+
+
+def _child_elements(node: Tag, tag: str) -> list[Tag]:
+    """Return the direct child elements of *node* with the given tag name."""
+    return [child for child in node.iter() if child.tag == tag]
+
+
+def _is_element(node: Tag, tag: str, class_name: str) -> bool:
+    """Return True if *node* is a *tag* element carrying the *class_name* token."""
+    return node.tag == tag and class_name in (
+        node.attributes.get("class") or ""
+    ).split()
+
+
+def _next_sibling_element(node: Tag, tag: str, class_name: str) -> Tag | None:
+    """Return the first following sibling matching *tag* and *class_name*."""
+    sibling = node.next
+    while sibling is not None:
+        if _is_element(sibling, tag, class_name):
+            return sibling
+        sibling = sibling.next
+    return None
 
 
 def _extract_toplines(toplines_div: Tag) -> list[Topline]:
@@ -90,33 +149,26 @@ def _extract_toplines(toplines_div: Tag) -> list[Topline]:
     """
     toplines: list[Topline] = []
 
-    for p in toplines_div.find_all("p", recursive=False):
-        text = _clean_text(p.get_text())
-        if not text:
+    for p in _child_elements(toplines_div, "p"):
+        full_text = _clean_text(p.text())
+        if not full_text:
             continue
 
         # Try to split on bold lead text
-        strong_tags = p.find_all("strong", recursive=True)
+        strong_tags = p.css("strong")
         if strong_tags:
-            headline_parts = []
-            for s in strong_tags:
-                headline_parts.append(_clean_text(s.get_text()))
-            headline = " ".join(headline_parts)
+            headline = " ".join(_clean_text(s.text()) for s in strong_tags)
 
-            # Body = full text minus headline portion
-            full_text = _clean_text(p.get_text())
+            # Body = full text minus headline portion. If the headline doesn't
+            # prefix the full text (e.g. whitespace differences), keep it all.
             body = full_text
-            # Try to find where headline ends in the full text
             if headline and full_text.startswith(headline):
                 body = full_text[len(headline) :].strip()
-            elif headline:
-                # Headline might be slightly different due to whitespace
-                body = full_text
 
             toplines.append(Topline(headline=headline, body=body))
         else:
             # No bold lead — treat entire paragraph as body with empty headline
-            toplines.append(Topline(headline="", body=text))
+            toplines.append(Topline(headline="", body=full_text))
 
     return toplines
 
@@ -124,10 +176,10 @@ def _extract_toplines(toplines_div: Tag) -> list[Topline]:
 def _extract_key_takeaways(takeaways_div: Tag) -> list[str]:
     """Extract ordered list of key takeaways."""
     takeaways: list[str] = []
-    ol = takeaways_div.find("ol")
+    ol = takeaways_div.css_first("ol")
     if ol:
-        for li in ol.find_all("li"):
-            text = _clean_text(li.get_text())
+        for li in ol.css("li"):
+            text = _clean_text(li.text())
             if text:
                 takeaways.append(text)
     return takeaways
@@ -139,30 +191,65 @@ def _extract_map_from_block(map_block: Tag) -> tuple[str | None, str | None]:
     map_title: str | None = None
 
     # Map image URL
-    img = map_block.find("img")
+    img = map_block.css_first("img")
     if img:
-        map_url = img.get("src")
+        map_url = img.attributes.get("src")
 
     # Map title — look for a sibling conflict-map-title div
-    title_div = map_block.find_next_sibling("div", class_="conflict-map-title")
+    title_div = _next_sibling_element(map_block, "div", "conflict-map-title")
     if title_div:
-        map_title = title_div.get("data-map-title")
+        map_title = title_div.attributes.get("data-map-title")
 
     return map_url, map_title
 
 
+def _section_paragraphs(section_div: Tag) -> list[Tag]:
+    """Return a section's body paragraphs in document order.
+
+    Every descendant <p> is included except those inside a
+    conflict-map-block div within the section.
+    """
+    # Compare nodes by mem_id: LexborNode equality serialises both subtrees
+    section_id = section_div.mem_id
+    paragraphs: list[Tag] = []
+    for p in section_div.css("p"):
+        ancestor = p.parent
+        while ancestor is not None and ancestor.mem_id != section_id:
+            if _is_element(ancestor, "div", "conflict-map-block"):
+                break
+            ancestor = ancestor.parent
+        else:
+            paragraphs.append(p)
+    return paragraphs
+
+
 def _extract_section_body(section_div: Tag) -> str:
     """Extract the text body of a section, excluding maps and sub-headings."""
     paragraphs: list[str] = []
-    for p in section_div.find_all("p"):
+    for p in _section_paragraphs(section_div):
         # Skip empty paragraphs
-        text = _clean_text(p.get_text())
+        text = _clean_text(p.text())
         if text:
             paragraphs.append(text)
     return "\n\n".join(paragraphs)
 
 
-def _extract_sections(soup: BeautifulSoup) -> list[Section]:
+def _index_data_ids(tree: HTMLTree) -> dict[str, Tag]:
+    """Map each data-id value to its first element, in document order.
+
+    Built in a single pass so the section lookups below don't each
+    re-walk the whole tree.
+    """
+    data_id_nodes: dict[str, Tag] = {}
+    for el in tree.css("[data-id]"):
+        # Valueless attributes (<div data-id>) come back as None; skip them
+        data_id = el.attributes["data-id"]
+        if data_id:
+            data_id_nodes.setdefault(data_id, el)
+    return data_id_nodes
+
+
+def _extract_sections(data_id_nodes: dict[str, Tag]) -> list[Section]:
     """Extract battlefield-direction sections from the report.
 
     Sections are identified by divs with a data-id attribute that are NOT
@@ -171,25 +258,24 @@ def _extract_sections(soup: BeautifulSoup) -> list[Section]:
     skip_ids = {"toplines", "key-takeaways", "endnotes"}
     sections: list[Section] = []
 
-    for div in soup.find_all(attrs={"data-id": True}):
-        section_id = div["data-id"]
+    for section_id, div in data_id_nodes.items():
         if section_id in skip_ids:
             continue
 
         # Section title from the 'title' attribute or first h2
-        section_title = div.get("title", "")
+        section_title = div.attributes.get("title") or ""
         if not section_title:
-            h2 = div.find("h2")
+            h2 = div.css_first("h2")
             if h2:
-                section_title = _clean_text(h2.get_text())
+                section_title = _clean_text(h2.text())
 
         # Maps within this section
         map_url: str | None = None
         map_title: str | None = None
-        map_blocks = div.find_all("div", class_="conflict-map-block")
-        if map_blocks:
-            # Use the first map block for the section's primary map
-            map_url, map_title = _extract_map_from_block(map_blocks[0])
+        # Use the first map block for the section's primary map
+        map_block = div.css_first("div.conflict-map-block")
+        if map_block:
+            map_url, map_title = _extract_map_from_block(map_block)
 
         body = _extract_section_body(div)
 
@@ -206,76 +292,112 @@ def _extract_sections(soup: BeautifulSoup) -> list[Section]:
     return sections
 
 
-def _extract_overview_map(soup: BeautifulSoup) -> str | None:
+def _extract_overview_map(data_id_nodes: dict[str, Tag]) -> str | None:
     """Extract the overview (country-wide) map URL.
 
     The overview map is typically the first conflict-map-block in the
     'ukr-ops' section, showing the full Russo-Ukrainian war map.
     """
-    ukr_ops = soup.find(attrs={"data-id": "ukr-ops"})
+    ukr_ops = data_id_nodes.get("ukr-ops")
     if ukr_ops:
-        first_map = ukr_ops.find("div", class_="conflict-map-block")
+        first_map = ukr_ops.css_first("div.conflict-map-block")
         if first_map:
-            img = first_map.find("img")
+            img = first_map.css_first("img")
             if img:
-                return img.get("src")
+                return img.attributes.get("src")
     return None
 
 
-def _extract_source_refs(soup: BeautifulSoup) -> list[str]:
+def _extract_source_refs(data_id_nodes: dict[str, Tag]) -> list[str]:
     """Extract footnote source references from the endnotes section."""
     refs: list[str] = []
-    endnotes = soup.find(attrs={"data-id": "endnotes"})
+    endnotes = data_id_nodes.get("endnotes")
     if not endnotes:
         return refs
 
-    for p in endnotes.find_all("p"):
-        text = p.get_text()
+    for p in endnotes.css("p"):
+        text = p.text()
+        if "http" not in text:
+            continue
+        # Collapse line breaks so wrapped " dot " separators still match
+        text = _clean_text(text)
         # Extract URLs from endnote text — handle ISW's 'dot' obfuscation
         # e.g. "https://tass dot ru/politika/26459009"
-        urls = re.findall(r"https?://[^\s,;]+", text)
-        for url in urls:
+        for url in _URL_RE.findall(text):
             # De-obfuscate ' dot ' → '.'
-            clean_url = url.replace(" dot ", ".")
-            refs.append(clean_url)
+            refs.append(url.replace(" dot ", "."))
 
     return refs
 
 
-def parse_report(html: str) -> ParsedReport:
+# Memoised parse results keyed by a hash of the input HTML
+_PARSE_CACHE_MAX = 32
+_parse_cache: dict[bytes, ParsedReport] = {}
+
+
+def parse_report(html: bytes | str) -> ParsedReport:
     """Parse an ISW HTML report into structured data.
 
+    Results are memoised by content hash, so re-parsing identical HTML in
+    one process (tests, local re-runs) is a hash, a dict lookup and a copy.
+    The ingestion service doesn't benefit from this: its GCS ``src_sha256``
+    check already skips identical HTML before parsing.
+
     Args:
-        html: Raw HTML string of the ISW report page.
+        html: Raw HTML of the ISW report page. Passing the undecoded UTF-8
+            bytes skips a Python-side decode; Lexbor decodes them in C.
 
     Returns:
         ParsedReport with extracted fields.
     """
-    soup = BeautifulSoup(html, "lxml")
+    if isinstance(html, str):
+        # surrogatepass: lone surrogates must not fail hashing when the
+        # parser itself accepts them
+        key = hashlib.blake2b(
+            html.encode("utf-8", "surrogatepass"), digest_size=16
+        ).digest()
+    else:
+        key = hashlib.blake2b(html, digest_size=16).digest()
+    report = _parse_cache.get(key)
+    if report is None:
+        report = _parse_report_uncached(html)
+        if len(_parse_cache) >= _PARSE_CACHE_MAX:
+            _parse_cache.clear()
+        _parse_cache[key] = report
+    # ParsedReport is mutable — never hand out the cached instance itself
+    return copy.deepcopy(report)
+
+
+def _parse_report_uncached(html: bytes | str) -> ParsedReport:
+    """Build a ParsedReport from HTML, bypassing the memoisation cache."""
+    tree = LexborHTMLParser(html)
 
     # Title
-    title_el = soup.find("h1")
-    title_text = _clean_text(title_el.get_text()) if title_el else ""
+    title_el = tree.css_first("h1")
+    title_text = _clean_text(title_el.text()) if title_el else ""
 
     # Date from title
     report_date = _extract_date_from_title(title_text)
 
+    # Index data-id sections once
+    data_id_nodes = _index_data_ids(tree)
+
     # Toplines
-    toplines_div = soup.find(attrs={"data-id": "toplines"})
+    toplines_div = data_id_nodes.get("toplines")
     toplines = _extract_toplines(toplines_div) if toplines_div else []
 
     # Key takeaways
-    takeaways_div = soup.find(attrs={"data-id": "key-takeaways"})
+    takeaways_div = data_id_nodes.get("key-takeaways")
     key_takeaways = _extract_key_takeaways(takeaways_div) if takeaways_div else []
 
     # Sections
-    sections = _extract_sections(soup)
+    sections = _extract_sections(data_id_nodes)
 
     # Overview map
-    overview_map_url = _extract_overview_map(soup)
+    overview_map_url = _extract_overview_map(data_id_nodes)
 
     # Source references
-    source_refs = _extract_source_refs(soup)
+    source_refs = _extract_source_refs(data_id_nodes)
 
     return ParsedReport(
         date=report_date,
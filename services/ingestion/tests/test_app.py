@@ -0,0 +1,148 @@
+"""Tests for the ingestion FastAPI service.
+
+GCS is replaced with an in-memory bucket; HTML is supplied via
+``html_gcs_path`` so no upstream fetch happens.
+"""
+
+from __future__ import annotations
+
+import gzip
+from pathlib import Path
+
+import pytest
+
+# Resolve paths relative to repo root
+REPO_ROOT = Path(__file__).resolve().parents[3]
+FIXTURE_PATH = REPO_ROOT / "examples" / "isw_report.html"
+
+# Add the service source to sys.path
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import app as ingestion_app  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+
+HTML_GCS_PATH = f"gs://{ingestion_app.BUCKET_NAME}/uploads/report.html"
+
+
+class FakeBlob:
+    def __init__(self, bucket: FakeBucket, name: str):
+        self.bucket = bucket
+        self.name = name
+        self.metadata: dict | None = None
+        self.content_encoding: str | None = None
+
+    def upload_from_string(self, data: bytes, content_type: str | None = None):
+        if self.name in self.bucket.fail_uploads:
+            raise RuntimeError(f"upload failed: {self.name}")
+        self.bucket.objects[self.name] = {
+            "data": data,
+            "metadata": self.metadata,
+            "content_encoding": self.content_encoding,
+        }
+
+    def download_as_bytes(self) -> bytes:
+        # Like the real client, return gzip-encoded objects decompressed
+        obj = self.bucket.objects[self.name]
+        if obj.get("content_encoding") == "gzip":
+            return gzip.decompress(obj["data"])
+        return obj["data"]
+
+
+class FakeBucket:
+    def __init__(self):
+        self.objects: dict[str, dict] = {}
+        self.fail_uploads: set[str] = set()
+
+    def blob(self, name: str) -> FakeBlob:
+        return FakeBlob(self, name)
+
+    def get_blob(self, name: str) -> FakeBlob | None:
+        if name not in self.objects:
+            return None
+        blob = FakeBlob(self, name)
+        blob.metadata = self.objects[name]["metadata"]
+        return blob
+
+
+@pytest.fixture()
+def bucket(monkeypatch: pytest.MonkeyPatch) -> FakeBucket:
+    fake = FakeBucket()
+    fake.objects["uploads/report.html"] = {
+        "data": FIXTURE_PATH.read_bytes(),
+        "metadata": None,
+    }
+    monkeypatch.setattr(ingestion_app, "_get_bucket", lambda: fake)
+    return fake
+
+
+@pytest.fixture()
+def client() -> TestClient:
+    with TestClient(ingestion_app.app) as c:
+        yield c
+
+
+def _ingest(client: TestClient, date: str = "2026-02-16"):
+    return client.post("/", json={"date": date, "html_gcs_path": HTML_GCS_PATH})
+
+
+# ---------------------------------------------------------------------------
+# Ingest endpoint
+# ---------------------------------------------------------------------------
+class TestIngest:
+    def test_stores_raw_and_parsed(self, client: TestClient, bucket: FakeBucket):
+        resp = _ingest(client)
+        assert resp.status_code == 200
+        assert resp.json()["parsed_report_path"].endswith(
+            "parsed/2026-02-16/parsed_report.json"
+        )
+        assert "raw/2026-02-16/report.html" in bucket.objects
+        assert "parsed/2026-02-16/parsed_report.json" in bucket.objects
+
+    def test_failed_raw_upload_is_retried(
+        self, client: TestClient, bucket: FakeBucket
+    ):
+        bucket.fail_uploads.add("raw/2026-02-16/report.html")
+        assert _ingest(client).status_code == 500
+        # No parsed blob may mark the date as done without its raw HTML
+        assert "parsed/2026-02-16/parsed_report.json" not in bucket.objects
+
+        bucket.fail_uploads.clear()
+        assert _ingest(client).status_code == 200
+        assert "raw/2026-02-16/report.html" in bucket.objects
+        assert "parsed/2026-02-16/parsed_report.json" in bucket.objects
+
+    def test_unchanged_html_skips_reparse(
+        self, client: TestClient, bucket: FakeBucket
+    ):
+        assert _ingest(client).status_code == 200
+        bucket.fail_uploads.add("parsed/2026-02-16/parsed_report.json")
+        # A cache hit must not touch the parsed blob again
+        assert _ingest(client).status_code == 200
+
+    def test_parser_version_change_reparses(
+        self, client: TestClient, bucket: FakeBucket, monkeypatch: pytest.MonkeyPatch
+    ):
+        assert _ingest(client).status_code == 200
+        parsed = bucket.objects["parsed/2026-02-16/parsed_report.json"]
+        assert parsed["metadata"]["parser_version"] == ingestion_app.PARSER_VERSION
+
+        monkeypatch.setattr(ingestion_app, "PARSER_VERSION", "next")
+        assert _ingest(client).status_code == 200
+        parsed = bucket.objects["parsed/2026-02-16/parsed_report.json"]
+        assert parsed["metadata"]["parser_version"] == "next"
+
+    def test_reingests_from_stored_raw_html(
+        self, client: TestClient, bucket: FakeBucket
+    ):
+        assert _ingest(client).status_code == 200
+        raw = bucket.objects["raw/2026-02-16/report.html"]
+        assert raw["content_encoding"] == "gzip"
+
+        raw_path = f"gs://{ingestion_app.BUCKET_NAME}/raw/2026-02-16/report.html"
+        resp = client.post(
+            "/", json={"date": "2026-02-17", "html_gcs_path": raw_path}
+        )
+        assert resp.status_code == 200
+        assert "parsed/2026-02-17/parsed_report.json" in bucket.objects
@@ -6,6 +6,7 @@ Uses the real example HTML fixture at examples/isw_report.html.
 from __future__ import annotations
 
 import json
+import time
 from pathlib import Path
 
 import pytest
@@ -19,6 +20,7 @@ import sys
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
+import parser as parser_module  # noqa: E402
 from parser import (  # noqa: E402
     ParsedReport,
     _clean_text,
@@ -28,12 +30,12 @@ from parser import (  # noqa: E402
 
 
 @pytest.fixture()
-def html_fixture() -> str:
-    return FIXTURE_PATH.read_text(encoding="utf-8")
+def html_fixture() -> bytes:
+    return FIXTURE_PATH.read_bytes()
 
 
 @pytest.fixture()
-def parsed(html_fixture: str) -> ParsedReport:
+def parsed(html_fixture: bytes) -> ParsedReport:
     return parse_report(html_fixture)
 
 
@@ -51,6 +53,9 @@ class TestDateExtraction:
     def test_extracts_date_december(self):
         assert _extract_date_from_title("Bar, December 31, 2025") == "2025-12-31"
 
+    def test_skips_non_month_word_before_date(self):
+        assert _extract_date_from_title("Day 5, 2026, March 3, 2026") == "2026-03-03"
+
     def test_raises_on_missing_date(self):
         with pytest.raises(ValueError, match="Could not extract date"):
             _extract_date_from_title("No date here")
@@ -67,6 +72,110 @@ class TestCleanText:
         assert _clean_text("hello\xa0world") == "hello world"
 
 
+# ---------------------------------------------------------------------------
+# Section bodies
+# ---------------------------------------------------------------------------
+class TestSectionBody:
+    def test_excludes_paragraphs_inside_map_blocks(self):
+        html = (
+            "<h1>Foo, January 1, 2025</h1>"
+            '<div data-id="ru-me">'
+            "<p>First.</p>"
+            '<div class="conflict-map-block"><img src="m.webp"><p>Caption</p></div>'
+            "<div><p>Second.</p></div>"
+            "</div>"
+        )
+        section = parse_report(html).sections[0]
+        assert section.body == "First.\n\nSecond."
+        assert section.map_url == "m.webp"
+
+    def test_skips_valueless_data_id(self):
+        html = (
+            "<h1>Foo, January 1, 2025</h1>"
+            '<div data-id><p>Orphan</p></div><div data-id=""><p>Empty</p></div>'
+            '<div data-id="s"><p>A</p></div>'
+        )
+        assert [s.id for s in parse_report(html).sections] == ["s"]
+
+    def test_keeps_nested_non_map_paragraphs(self):
+        html = (
+            "<h1>Foo, January 1, 2025</h1>"
+            '<div data-id="s"><p>A</p>'
+            "<div><div><p>Deep</p></div></div>"
+            "<blockquote><p>Quote</p></blockquote>"
+            '<div class="wrapper conflict-map-block-extra"><p>Kept</p></div>'
+            "</div>"
+        )
+        assert parse_report(html).sections[0].body == "A\n\nDeep\n\nQuote\n\nKept"
+
+    def test_excludes_captions_at_any_depth_in_map_blocks(self):
+        html = (
+            "<h1>Foo, January 1, 2025</h1>"
+            '<div data-id="s"><p>A</p>'
+            '<div class="conflict-map-block">'
+            "<figure><div><p>Deep caption</p></div></figure>"
+            "</div>"
+            "</div>"
+        )
+        assert parse_report(html).sections[0].body == "A"
+
+    def test_large_nested_section_scales_linearly(self):
+        # Each paragraph sits two wrappers deep, so every one walks ancestors.
+        # Comparing nodes by serialised HTML made this take seconds.
+        count = 2000
+        paragraphs = "".join(
+            f"<div><div><p>Para {i} {'x' * 200}</p></div></div>"
+            for i in range(count)
+        )
+        html = f'<h1>Foo, January 1, 2025</h1><div data-id="s">{paragraphs}</div>'
+
+        start = time.perf_counter()
+        report = parser_module._parse_report_uncached(html)
+        elapsed = time.perf_counter() - start
+
+        assert report.sections[0].body.count("\n\n") == count - 1
+        assert elapsed < 1.0
+
+
+# ---------------------------------------------------------------------------
+# Parse cache
+# ---------------------------------------------------------------------------
+def _minimal_report(day: int) -> str:
+    return f"<h1>Foo, January {day}, 2025</h1>"
+
+
+class TestParseCache:
+    @pytest.fixture(autouse=True)
+    def empty_cache(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(parser_module, "_parse_cache", {})
+
+    def test_reparse_hits_cache(self, monkeypatch: pytest.MonkeyPatch):
+        calls = []
+        uncached = parser_module._parse_report_uncached
+
+        def counting(html):
+            calls.append(html)
+            return uncached(html)
+
+        monkeypatch.setattr(parser_module, "_parse_report_uncached", counting)
+        first = parse_report(_minimal_report(1))
+        second = parse_report(_minimal_report(1))
+        assert len(calls) == 1
+        assert first == second
+
+    def test_str_with_lone_surrogate(self):
+        html = '<h1>Foo, January 1, 2025</h1><div data-id="s"><p>a\udc80</p></div>'
+        assert parse_report(html).sections[0].id == "s"
+
+    def test_cache_clears_when_full(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(parser_module, "_PARSE_CACHE_MAX", 2)
+        parse_report(_minimal_report(1))
+        parse_report(_minimal_report(2))
+        assert len(parser_module._parse_cache) == 2
+        parse_report(_minimal_report(3))
+        assert len(parser_module._parse_cache) == 1
+
+
 # ---------------------------------------------------------------------------
 # Full parse against fixture
 # ---------------------------------------------------------------------------
@@ -135,6 +244,15 @@ class TestParseReport:
         for ref in parsed.source_refs:
             assert " dot " not in ref
 
+    def test_source_refs_keep_full_obfuscated_url(self, parsed: ParsedReport):
+        # URLs written as "https://tass dot ru/..." must not be cut at the space
+        assert "https://tass.ru/politika/26459009" in parsed.source_refs
+        # ...including when the obfuscated URL wraps across lines
+        assert (
+            "https://www.rbc.ru/politics/16/02/2026/6992e5719a7947729b65d137"
+            in parsed.source_refs
+        )
+
     def test_serializable_to_json(self, parsed: ParsedReport):
         d = parsed.to_dict()
         json_str = json.dumps(d, ensure_ascii=False)
@@ -143,6 +261,14 @@ class TestParseReport:
         assert roundtrip["date"] == "2026-02-16"
         assert len(roundtrip["key_takeaways"]) == 6
 
+    def test_cached_reparse_returns_independent_copy(
+        self, html_fixture: bytes, parsed: ParsedReport
+    ):
+        parsed.key_takeaways.clear()
+        again = parse_report(html_fixture)
+        assert again is not parsed
+        assert len(again.key_takeaways) == 6
+
     def test_no_duplicate_sections(self, parsed: ParsedReport):
         ids = [s.id for s in parsed.sections]
         assert len(ids) == len(set(ids))